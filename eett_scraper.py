@@ -12,38 +12,173 @@ Author: George Panagiotou
 License: MIT
 """
 
-import requests
-import pandas as pd
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 import time
 import csv
+import gzip
+import hashlib
 import sys
 import os
+from pathlib import Path
 from urllib.parse import urljoin
 import re
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 
 
-class EETTScraper:
+# Headers sent with every request to mimic a real browser
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'el-GR,el;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Upgrade-Insecure-Requests': '1',
+    'Referer': 'https://keraies.eett.gr/anazhthsh.php'
+}
+
+# Output columns, in order
+FIELDNAMES = ['sequence', 'position_code', 'category', 'company', 'address', 'municipality']
+
+# One antenna record, with values in FIELDNAMES order
+AntennaRow = Tuple[str, str, str, str, str, str]
+
+# Outcome of a municipality search in batch mode
+_SEARCH_OK = 'ok'
+_SEARCH_NOT_FOUND = 'not found'
+_SEARCH_FAILED = 'request failed'
+
+# Page number in the onclick handler of pagination links
+_START_PAGE_RE = re.compile(r"startPage\.value='?(\d+)'?")
+
+# Used to turn municipality names into safe filenames
+_SAFE_FILENAME_RE1 = re.compile(r'[^\w\s-]')
+_SAFE_FILENAME_RE2 = re.compile(r'[-\s]+')
+
+# Words whose presence on a page without results hints at what went wrong
+_INDICATORS = ['αποτελέσματα', 'σφάλμα', 'error', 'κεραία', 'antenna']
+_INDICATOR_RE = re.compile('|'.join(map(re.escape, _INDICATORS)), re.IGNORECASE)
+
+# Charset declared in a <meta charset> or <meta http-equiv="Content-Type"> tag
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+# Header cell substrings mapped to field names, checked in order; a cell is
+# assigned to the first rule whose substrings all occur in its text
+_HEADER_RULES = [
+    (('Κωδ.', 'θέσης'), 'position_code'),
+    (('Κατηγορία',), 'category'),
+    (('Εταιρία',), 'company'),
+    (('Διεύθυνση',), 'address'),
+    (('Δήμος',), 'municipality'),
+    (('Κωδ. Θέσης',), 'sequence'),
+]
+
+
+def _decode_html(content: bytes, encoding: Optional[str] = None) -> str:
     """
-    A scraper for the EETT (Greek Telecommunications Commission) antenna database.
+    Decode an HTML body to text.
     
-    This class provides methods to search for antenna installations by municipality
-    and extract detailed information about each installation.
+    Uses the charset from the HTTP Content-Type header when given, otherwise the
+    one declared in a <meta> tag near the top of the page, falling back to UTF-8.
     """
+    if not encoding:
+        match = _META_CHARSET_RE.search(content[:4096])
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return content.decode(encoding, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+
+class ResponseCache:
+    """
+    On-disk cache of raw response bodies.
     
-    def __init__(self, debug: bool = False):
+    Entries are keyed by the request URL and form data and stored gzipped, one
+    file per request, so reruns replay pages instead of fetching them again.
+    The charset from the response headers is kept in front of the body, so a
+    replayed page is decoded the same way as the live one.
+    """
+    
+    def __init__(self, directory: str = '.cache', expire_after: Optional[float] = 86400):
         """
-        Initialize the EETT scraper.
+        Initialize the response cache.
+        
+        Args:
+            directory (str): Directory holding the cached responses
+            expire_after (Optional[float]): Seconds after which entries are stale (None to never expire)
+        """
+        self.directory = Path(directory)
+        self.expire_after = expire_after
+        self.logger = logging.getLogger(__name__)
+    
+    def _path(self, url: str, data: Optional[Dict[str, str]]) -> Path:
+        """Return the cache file path for a request."""
+        key = url + repr(sorted((data or {}).items()))
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.page.gz"
+    
+    def get(self, url: str, data: Optional[Dict[str, str]] = None) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Return the cached response body and charset for a request, or None on a miss."""
+        path = self._path(url, data)
+        try:
+            if self.expire_after is not None and time.time() - path.stat().st_mtime > self.expire_after:
+                return None
+            with gzip.open(path, 'rb') as f:
+                encoding = f.readline().rstrip(b'\n').decode('ascii')
+                return f.read(), encoding or None
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+    
+    def set(self, url: str, data: Optional[Dict[str, str]], content: bytes,
+            encoding: Optional[str] = None) -> None:
+        """Store the response body and charset for a request. Failures are logged, never raised."""
+        path = self._path(url, data)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write((encoding or '').encode('ascii') + b'\n')
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug(f"Failed to write cache entry {path}: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+class BaseEETTScraper:
+    """
+    Shared state, parsing and export for the EETT scrapers.
+    
+    Performs no network I/O of its own: EETTScraper and AsyncEETTScraper add
+    synchronous and asynchronous fetching on top of it.
+    """
+    
+    def __init__(self, debug: bool = False, cache: Optional[ResponseCache] = None,
+                 dump_html: bool = False, dump_dir: str = '.'):
+        """
+        Initialize the shared scraper state.
         
         Args:
             debug (bool): Enable debug mode for verbose logging
+            cache (Optional[ResponseCache]): Cache for raw responses (None to disable caching)
+            dump_html (bool): Save every results page as gzipped HTML for troubleshooting
+            dump_dir (str): Directory for the HTML dumps
         """
         self.base_url = "https://keraies.eett.gr/"
         self.search_url = "https://keraies.eett.gr/anazhthsh.php"
-        self.session = requests.Session()
+        self.results_url = urljoin(self.base_url, "getData.php")
+        self.cache = cache
         self.debug = debug
+        self.dump_html = dump_html
+        self.dump_dir = dump_dir
+        self._search_page_tree: Optional[LexborHTMLParser] = None
+        self._search_page_from_cache = False
+        self._municipality_options: Optional[Dict[str, str]] = None
+        self._municipality_lower: Dict[str, Tuple[str, str]] = {}
         
         # Configure logging
         log_level = logging.DEBUG if debug else logging.INFO
@@ -52,79 +187,44 @@ class EETTScraper:
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
-        
-        # Set headers to mimic a real browser
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'el-GR,el;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Referer': 'https://keraies.eett.gr/anazhthsh.php'
-        })
     
-    def get_municipality_options(self) -> Dict[str, str]:
-        """
-        Retrieve available municipality options from the search form.
-        
-        Returns:
-            Dict[str, str]: Dictionary mapping municipality names to their form values
-        """
-        try:
-            response = self.session.get(self.search_url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            municipality_select = soup.find('select', {'name': 'municipality'})
-            
-            if municipality_select:
-                options = {}
-                for option in municipality_select.find_all('option'):
-                    value = option.get('value', '')
-                    text = option.get_text(strip=True)
-                    if value and text and value != '':
-                        options[text] = value
-                return options
-            return {}
-            
-        except requests.RequestException as e:
-            self.logger.error(f"Error getting municipality options: {e}")
-            return {}
-
-    def search_municipality(self, municipality_name: str, max_pages: Optional[int] = None) -> List[Dict[str, str]]:
-        """
-        Search for antenna data in a specific municipality.
-        
-        Args:
-            municipality_name (str): Name of the municipality to search
-            max_pages (Optional[int]): Maximum number of pages to scrape (None for all pages)
-        
-        Returns:
-            List[Dict[str, str]]: List of dictionaries containing antenna data
-        """
-        self.logger.info(f"Searching for antennas in municipality: {municipality_name}")
-        
-        # Get municipality options to find the correct value
-        municipality_options = self.get_municipality_options()
-        municipality_value = self._find_municipality_value(municipality_name, municipality_options)
+    def _has_search_form(self, tree: LexborHTMLParser) -> bool:
+        """Check whether a page contains the municipality search form."""
+        return tree.css_first('select[name="municipality"]') is not None
+    
+    def _parse_municipality_options(self, tree: LexborHTMLParser) -> Dict[str, str]:
+        """Extract municipality options from the search form."""
+        municipality_select = tree.css_first('select[name="municipality"]')
         
-        if not municipality_value:
-            self.logger.error(f"Municipality '{municipality_name}' not found")
-            self._show_available_municipalities(municipality_options)
-            return []
+        if municipality_select:
+            options = {}
+            for option in municipality_select.css('option'):
+                value = option.attributes.get('value') or ''
+                text = option.text(strip=True)
+                if value and text and value != '':
+                    options[text] = value
+            return options
+        return {}
+    
+    def _set_municipality_options(self, options: Dict[str, str]) -> None:
+        """Memoize the municipality options along with their lowercase lookup index."""
+        self._municipality_options = options
+        self._municipality_lower = {name.lower(): (name, value) for name, value in options.items()}
+    
+    def _find_municipality_value(self, municipality_name: str) -> Optional[str]:
+        """Find the form value for a given municipality name in the memoized options."""
+        needle = municipality_name.lower()
         
-        # Get search form structure
-        search_data = self._prepare_search_data(municipality_value)
-        if not search_data:
-            return []
+        # Exact (case-insensitive) matches are a dict lookup
+        hit = self._municipality_lower.get(needle)
+        if hit:
+            name, value = hit
+            self.logger.info(f"Found municipality match: {name} (value: {value})")
+            return value
         
-        return self._scrape_all_pages(search_data, max_pages)
-    
-    def _find_municipality_value(self, municipality_name: str, municipality_options: Dict[str, str]) -> Optional[str]:
-        """Find the form value for a given municipality name."""
-        for name, value in municipality_options.items():
-            if municipality_name.lower() in name.lower() or name.lower() in municipality_name.lower():
+        for name, value in (self._municipality_options or {}).items():
+            haystack = name.lower()
+            if needle in haystack or haystack in needle:
                 self.logger.info(f"Found municipality match: {name} (value: {value})")
                 return value
         return None
@@ -135,167 +235,154 @@ class EETTScraper:
         for name in list(municipality_options.keys())[:10]:
             self.logger.info(f"  - {name}")
     
-    def _prepare_search_data(self, municipality_value: str) -> Optional[Dict[str, str]]:
-        """Prepare the search form data."""
-        try:
-            response = self.session.get(self.search_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Get hidden form fields
-            hidden_inputs = soup.find_all('input', {'type': 'hidden'})
-            self.logger.debug(f"Found {len(hidden_inputs)} hidden form fields")
-            
-            search_data = {
-                'address': '',
-                'municipality': municipality_value,
-                'siteId': '',
-            }
-            
-            # Add hidden form fields
-            for hidden_input in hidden_inputs:
-                name = hidden_input.get('name')
-                value = hidden_input.get('value', '')
-                if name:
-                    search_data[name] = value
-            
-            self.logger.debug(f"Search data prepared: {search_data}")
-            return search_data
-            
-        except requests.RequestException as e:
-            self.logger.error(f"Error accessing search page: {e}")
-            return None
+    def _parse_search_data(self, tree: LexborHTMLParser, municipality_value: str) -> Dict[str, str]:
+        """Build the search form data from the search page."""
+        # Get hidden form fields
+        hidden_inputs = tree.css('input[type="hidden"]')
+        self.logger.debug(f"Found {len(hidden_inputs)} hidden form fields")
+        
+        search_data = {
+            'address': '',
+            'municipality': municipality_value,
+            'siteId': '',
+        }
+        
+        # Add hidden form fields
+        for hidden_input in hidden_inputs:
+            name = hidden_input.attributes.get('name')
+            value = hidden_input.attributes.get('value') or ''
+            if name:
+                search_data[name] = value
+        
+        self.logger.debug(f"Search data prepared: {search_data}")
+        return search_data
     
-    def _scrape_all_pages(self, search_data: Dict[str, str], max_pages: Optional[int]) -> List[Dict[str, str]]:
-        """Scrape all pages of results."""
+    def _replay_cached_pages(self, search_data: Dict[str, str],
+                             max_pages: Optional[int]) -> Optional[List[AntennaRow]]:
+        """
+        Rebuild a search from cached results pages.
+        
+        Returns None unless every page of the search is cached, so a run never
+        mixes cached pages with freshly fetched ones.
+        """
         all_antennas = []
         page_num = 1
         
         while True:
-            if max_pages and page_num > max_pages:
-                break
-                
-            self.logger.info(f"Scraping page {page_num}...")
+            cached = self.cache.get(self.results_url, self._page_search_data(search_data, page_num))
+            if cached is None:
+                if page_num > 1:
+                    self.logger.debug(f"Page {page_num} is not cached, fetching all pages again")
+                return None
             
-            current_search_data = search_data.copy()
-            current_search_data['startPage'] = page_num
-            current_search_data['myAction'] = 'search' if page_num == 1 else 'page'
+            content, encoding = cached
+            antennas_on_page, tree = self._process_page(content, encoding, search_data, page_num)
+            if not antennas_on_page:
+                return None
+            all_antennas.extend(antennas_on_page)
             
-            try:
-                response = self._make_search_request(current_search_data)
-                if not response:
-                    break
-                
-                # Save debug files if in debug mode
-                if self.debug and page_num <= 2:
-                    self._save_debug_response(response, page_num)
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                antennas_on_page = self._parse_results(soup)
-                
-                if not antennas_on_page:
-                    self.logger.warning("No antennas found on this page")
-                    if self.debug:
-                        self._debug_page_structure(soup)
-                    if page_num == 1:
-                        self.logger.warning("First page returned no results")
-                    break
-                
-                all_antennas.extend(antennas_on_page)
-                self.logger.info(f"Found {len(antennas_on_page)} antennas on page {page_num}")
-                
-                if not self._has_next_page(soup, page_num):
-                    break
-                    
-                page_num += 1
-                time.sleep(1)  # Be respectful to the server
-                
-            except requests.RequestException as e:
-                self.logger.error(f"Error on page {page_num}: {e}")
+            if (max_pages and page_num >= max_pages) or not self._has_next_page(tree, page_num):
                 break
+            page_num += 1
         
+        self.logger.info(f"Replayed {page_num} pages from cache")
         self.logger.info(f"Total antennas found: {len(all_antennas)}")
         return all_antennas
     
-    def _make_search_request(self, search_data: Dict[str, str]) -> Optional[requests.Response]:
-        """Make a search request to the server."""
-        try:
-            response = self.session.post(
-                urljoin(self.base_url, "getData.php"),
-                data=search_data,
-                headers={
-                    'Content-Type': 'application/x-www-form-urlencoded',
-                    'Referer': self.search_url
-                }
-            )
-            response.raise_for_status()
-            return response
-        except requests.RequestException as e:
-            self.logger.error(f"Search request failed: {e}")
-            return None
+    def _store_cached_pages(self, pages: List[Tuple[Dict[str, str], bytes, Optional[str]]]) -> None:
+        """Cache the results pages of a search, given as (form data, body, charset) tuples."""
+        for page_data, content, encoding in pages:
+            self.cache.set(self.results_url, page_data, content, encoding)
     
-    def _save_debug_response(self, response: requests.Response, page_num: int) -> None:
-        """Save response HTML for debugging purposes."""
-        filename = f'debug_response_page_{page_num}.html'
+    def _page_search_data(self, search_data: Dict[str, str], page_num: int) -> Dict[str, str]:
+        """Build the form data for a specific results page."""
+        page_data = search_data.copy()
+        page_data['startPage'] = str(page_num)
+        page_data['myAction'] = 'search' if page_num == 1 else 'page'
+        return page_data
+    
+    def _process_page(self, content: bytes, encoding: Optional[str], search_data: Dict[str, str],
+                      page_num: int) -> Tuple[List[AntennaRow], LexborHTMLParser]:
+        """Parse a results page, dumping and analysing it when requested."""
+        if self.dump_html:
+            self._save_debug_response(content, search_data['municipality'], page_num)
+        
+        page_html = _decode_html(content, encoding)
+        tree = LexborHTMLParser(page_html)
+        antennas = self._parse_results(tree)
+        
+        if antennas:
+            self.logger.info(f"Found {len(antennas)} antennas on page {page_num}")
+        else:
+            self.logger.warning(f"No antennas found on page {page_num}")
+            if self.debug:
+                self._debug_page_structure(tree, page_html)
+        
+        return antennas, tree
+    
+    def _save_debug_response(self, content: bytes, municipality_value: str, page_num: int) -> None:
+        """Save response HTML, gzipped, for debugging purposes."""
+        # Include the municipality so concurrent searches don't overwrite each other's dumps
+        safe_value = _SAFE_FILENAME_RE2.sub('_', _SAFE_FILENAME_RE1.sub('', municipality_value).strip())
+        filename = os.path.join(self.dump_dir, f'debug_response_{safe_value}_page_{page_num}.html.gz')
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(response.text)
+            with gzip.open(filename, 'wb') as f:
+                f.write(content)
             self.logger.debug(f"Saved response HTML to {filename}")
         except IOError as e:
             self.logger.error(f"Failed to save debug file: {e}")
     
-    def _parse_results(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _parse_results(self, tree: LexborHTMLParser) -> List[AntennaRow]:
         """Parse results from the HTML response."""
-        tables = soup.find_all('table')
-        for table in tables:
-            antennas = self._parse_table_results(table)
+        for table in tree.css('table'):
+            # Classify the table by its first row before collecting all of its rows,
+            # so layout tables are skipped cheaply
+            header_row = table.css_first('tr')
+            if header_row is None:
+                continue
+            
+            header_map = self._map_table_headers(header_row)
+            if not self._validate_header_map(header_map):
+                continue
+            
+            antennas = self._parse_table_results(table, header_map)
             if antennas:
                 self.logger.debug(f"Successfully parsed {len(antennas)} antennas from table")
                 return antennas
         return []
     
-    def _parse_table_results(self, table) -> List[Dict[str, str]]:
-        """Parse antenna data from HTML table."""
-        rows = table.find_all('tr')
+    def _parse_table_results(self, table: LexborNode, header_map: Dict[str, int]) -> List[AntennaRow]:
+        """Parse antenna data from an HTML table with a validated header row."""
+        rows = table.css('tr')
         if len(rows) < 2:
             return []
         
-        # Map table headers to field names
-        header_map = self._map_table_headers(rows[0])
-        if not self._validate_header_map(header_map):
-            return []
-        
         self.logger.debug(f"Found antenna table with headers: {header_map}")
         
+        # Column index of each output field, -1 for optional columns that are missing
+        slots = tuple(header_map.get(field, -1) for field in FIELDNAMES)
+        max_index = max(slots)
+        
         # Parse data rows
         antennas = []
         for row in rows[1:]:
-            cells = row.find_all('td')
-            if len(cells) > max(header_map.values()):
-                antenna_data = self._extract_antenna_data(cells, header_map)
-                antennas.append(antenna_data)
+            cells = row.css('td')
+            if len(cells) > max_index:
+                antennas.append(tuple(cells[i].text(strip=True) if i >= 0 else '' for i in slots))
         
         return antennas
     
-    def _map_table_headers(self, header_row) -> Dict[str, int]:
+    def _map_table_headers(self, header_row: LexborNode) -> Dict[str, int]:
         """Map table headers to column indices."""
-        header_cells = header_row.find_all(['th', 'td'])
+        header_cells = header_row.css('th, td')
         header_map = {}
         
         for i, cell in enumerate(header_cells):
-            text = cell.get_text(strip=True)
-            if 'Κωδ.' in text and 'θέσης' in text:
-                header_map['position_code'] = i
-            elif 'Κατηγορία' in text:
-                header_map['category'] = i
-            elif 'Εταιρία' in text:
-                header_map['company'] = i
-            elif 'Διεύθυνση' in text:
-                header_map['address'] = i
-            elif 'Δήμος' in text:
-                header_map['municipality'] = i
-            elif 'Κωδ. Θέσης' in text:
-                header_map['sequence'] = i
+            text = cell.text(strip=True)
+            for needles, field in _HEADER_RULES:
+                if all(needle in text for needle in needles):
+                    header_map[field] = i
+                    break
         
         return header_map
     
@@ -309,79 +396,86 @@ class EETTScraper:
             return False
         return True
     
-    def _extract_antenna_data(self, cells, header_map: Dict[str, int]) -> Dict[str, str]:
-        """Extract antenna data from table cells."""
-        return {
-            'sequence': cells[header_map.get('sequence', 0)].get_text(strip=True) if 'sequence' in header_map else '',
-            'position_code': cells[header_map['position_code']].get_text(strip=True),
-            'category': cells[header_map.get('category', 0)].get_text(strip=True) if 'category' in header_map else '',
-            'company': cells[header_map['company']].get_text(strip=True),
-            'address': cells[header_map['address']].get_text(strip=True),
-            'municipality': cells[header_map['municipality']].get_text(strip=True)
-        }
-    
-    def _debug_page_structure(self, soup: BeautifulSoup) -> None:
+    def _debug_page_structure(self, tree: LexborHTMLParser, page_html: str) -> None:
         """Debug helper to understand page structure."""
         if not self.debug:
             return
             
         self.logger.debug("Analyzing page structure...")
         
-        tables = soup.find_all('table')
+        tables = tree.css('table')
         self.logger.debug(f"Found {len(tables)} tables")
         
         # Check pagination
-        pagination_ul = soup.find('ul', class_='pagination')
+        pagination_ul = tree.css_first('ul.pagination')
         if pagination_ul:
-            pagination_items = pagination_ul.find_all('li')
+            pagination_items = pagination_ul.css('li')
             self.logger.debug(f"Found pagination with {len(pagination_items)} items")
         
-        # Check for result indicators
-        page_text = soup.get_text().lower()
-        indicators = ['αποτελέσματα', 'σφάλμα', 'error', 'κεραία', 'antenna']
-        found_indicators = [ind for ind in indicators if ind in page_text]
+        # Check for result indicators, scanning the HTML rather than the extracted text
+        found = {match.group(0).lower() for match in _INDICATOR_RE.finditer(page_html)}
+        found_indicators = [ind for ind in _INDICATORS if ind in found]
         if found_indicators:
             self.logger.debug(f"Found content indicators: {found_indicators}")
     
-    def _has_next_page(self, soup: BeautifulSoup, current_page_num: int) -> bool:
+    def _has_next_page(self, tree: LexborHTMLParser, current_page_num: int) -> bool:
         """Check if there's a next page available."""
-        pagination_ul = soup.find('ul', class_='pagination')
+        pagination_ul = tree.css_first('ul.pagination')
         if not pagination_ul:
             return False
         
-        pagination_items = pagination_ul.find_all('li')
+        pagination_items = pagination_ul.css('li')
         
         # Look for next page indicators
         for li in pagination_items:
             # Check for "Next Page" link
-            title = li.get('title', '')
-            classes = li.get('class', [])
+            title = li.attributes.get('title') or ''
+            classes = (li.attributes.get('class') or '').split()
             
             if ('Επόμενη' in title or 'Next' in title) and 'disabled' not in classes:
                 return True
             
             # Check for page numbers greater than current
-            a_tag = li.find('a')
+            a_tag = li.css_first('a')
             if a_tag:
-                text = a_tag.get_text(strip=True)
-                onclick = a_tag.get('onclick', '')
+                text = a_tag.text(strip=True)
+                onclick = a_tag.attributes.get('onclick') or ''
                 
                 if text.isdigit() and int(text) > current_page_num:
                     return True
                 
                 # Check onclick for page numbers
-                match = re.search(r"startPage\.value='?(\d+)'?", onclick)
+                match = _START_PAGE_RE.search(onclick)
                 if match and int(match.group(1)) > current_page_num:
                     return True
         
         return False
     
-    def save_to_csv(self, data: List[Dict[str, str]], filename: str = 'antenna_data.csv') -> None:
+    def _last_page_number(self, tree: LexborHTMLParser) -> int:
+        """Return the highest page number linked from the pagination bar."""
+        last_page = 1
+        pagination_ul = tree.css_first('ul.pagination')
+        if not pagination_ul:
+            return last_page
+        
+        for a_tag in pagination_ul.css('li a'):
+            text = a_tag.text(strip=True)
+            if text.isdigit():
+                last_page = max(last_page, int(text))
+            
+            onclick = a_tag.attributes.get('onclick') or ''
+            match = _START_PAGE_RE.search(onclick)
+            if match:
+                last_page = max(last_page, int(match.group(1)))
+        
+        return last_page
+    
+    def save_to_csv(self, data: List[AntennaRow], filename: str = 'antenna_data.csv') -> None:
         """
         Save the scraped data to a CSV file.
         
         Args:
-            data: List of antenna data dictionaries
+            data: List of antenna records
             filename: Output filename
         """
         if not data:
@@ -389,11 +483,9 @@ class EETTScraper:
             return
         
         try:
-            fieldnames = ['sequence', 'position_code', 'category', 'company', 'address', 'municipality']
-            
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+                writer = csv.writer(csvfile)
+                writer.writerow(FIELDNAMES)
                 writer.writerows(data)
             
             self.logger.info(f"Data saved to {filename}")
@@ -401,12 +493,12 @@ class EETTScraper:
         except IOError as e:
             self.logger.error(f"Error saving CSV file: {e}")
     
-    def save_to_excel(self, data: List[Dict[str, str]], filename: str = 'antenna_data.xlsx') -> None:
+    def save_to_excel(self, data: List[AntennaRow], filename: str = 'antenna_data.xlsx') -> None:
         """
         Save the scraped data to an Excel file.
         
         Args:
-            data: List of antenna data dictionaries
+            data: List of antenna records
             filename: Output filename
         """
         if not data:
@@ -414,14 +506,574 @@ class EETTScraper:
             return
         
         try:
-            df = pd.DataFrame(data)
-            df.to_excel(filename, index=False)
+            import xlsxwriter
+        except ImportError:
+            self.logger.error("Excel export requires xlsxwriter (pip install xlsxwriter)")
+            return
+        
+        try:
+            # constant_memory flushes each row to disk instead of buffering the sheet
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, FIELDNAMES)
+            for row_num, row in enumerate(data, 1):
+                worksheet.write_row(row_num, 0, row)
+            workbook.close()
             self.logger.info(f"Data saved to {filename}")
             
         except Exception as e:
             self.logger.error(f"Error saving Excel file: {e}")
 
 
+class EETTScraper(BaseEETTScraper):
+    """
+    A scraper for the EETT (Greek Telecommunications Commission) antenna database.
+    
+    This class provides methods to search for antenna installations by municipality
+    and extract detailed information about each installation.
+    """
+    
+    def __init__(self, debug: bool = False, cache: Optional[ResponseCache] = None,
+                 dump_html: bool = False, dump_dir: str = '.'):
+        """
+        Initialize the EETT scraper.
+        
+        Args:
+            debug (bool): Enable debug mode for verbose logging
+            cache (Optional[ResponseCache]): Cache for raw responses (None to disable caching)
+            dump_html (bool): Save every results page as gzipped HTML for troubleshooting
+            dump_dir (str): Directory for the HTML dumps
+        """
+        super().__init__(debug=debug, cache=cache, dump_html=dump_html, dump_dir=dump_dir)
+        self.session = httpx.Client(http2=True, headers=DEFAULT_HEADERS, timeout=30, follow_redirects=True)
+        self._last_req_ts: Optional[float] = None
+    
+    def _fetch(self, url: str, data: Optional[Dict[str, str]] = None,
+               headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Optional[str]]:
+        """
+        GET a URL, or POST form data to it, at most one request per second.
+        
+        Returns the raw body and the charset from the Content-Type header, if any.
+        """
+        # Be respectful to the server, counting time spent parsing towards the delay
+        if self._last_req_ts is not None:
+            delay = 1.0 - (time.monotonic() - self._last_req_ts)
+            if delay > 0:
+                time.sleep(delay)
+        
+        try:
+            if data is None:
+                response = self.session.get(url, headers=headers)
+            else:
+                response = self.session.post(url, data=data, headers=headers)
+        finally:
+            self._last_req_ts = time.monotonic()
+        response.raise_for_status()
+        return response.content, response.charset_encoding
+    
+    def get_municipality_options(self) -> Dict[str, str]:
+        """
+        Retrieve available municipality options from the search form.
+        
+        Returns:
+            Dict[str, str]: Dictionary mapping municipality names to their form values
+        """
+        if self._municipality_options is not None:
+            return self._municipality_options
+        
+        try:
+            tree = self._fetch_search_page()
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error getting municipality options: {e}")
+            return {}
+        
+        if not self._has_search_form(tree):
+            self.logger.error("Search page does not contain the municipality form")
+            return {}
+        
+        self._set_municipality_options(self._parse_municipality_options(tree))
+        return self._municipality_options
+    
+    def _fetch_search_page(self, refresh: bool = False) -> LexborHTMLParser:
+        """
+        Fetch and parse the search page, keeping it once it contains the search form.
+        
+        With refresh, a page replayed from the cache is replaced by a live one.
+        """
+        if self._search_page_tree is None or (refresh and self._search_page_from_cache):
+            cached = self.cache.get(self.search_url) if self.cache and not refresh else None
+            content, encoding = cached if cached is not None else self._fetch(self.search_url)
+            tree = LexborHTMLParser(_decode_html(content, encoding))
+            
+            # Only keep a page that actually contains the search form
+            if not self._has_search_form(tree):
+                return tree
+            if self.cache and cached is None:
+                self.cache.set(self.search_url, None, content, encoding)
+            self._search_page_tree = tree
+            self._search_page_from_cache = cached is not None
+        return self._search_page_tree
+    
+    def search_municipality(self, municipality_name: str, max_pages: Optional[int] = None) -> List[AntennaRow]:
+        """
+        Search for antenna data in a specific municipality.
+        
+        Args:
+            municipality_name (str): Name of the municipality to search
+            max_pages (Optional[int]): Maximum number of pages to scrape (None for all pages)
+        
+        Returns:
+            List[AntennaRow]: Antenna records, with values in FIELDNAMES order
+        """
+        self.logger.info(f"Searching for antennas in municipality: {municipality_name}")
+        
+        # Get municipality options to find the correct value
+        municipality_options = self.get_municipality_options()
+        municipality_value = self._find_municipality_value(municipality_name)
+        
+        if not municipality_value:
+            self.logger.error(f"Municipality '{municipality_name}' not found")
+            self._show_available_municipalities(municipality_options)
+            return []
+        
+        # Get search form structure
+        search_data = self._prepare_search_data(municipality_value)
+        if not search_data:
+            return []
+        
+        return self._scrape_all_pages(search_data, max_pages)
+    
+    def _prepare_search_data(self, municipality_value: str) -> Optional[Dict[str, str]]:
+        """Prepare the search form data."""
+        try:
+            return self._parse_search_data(self._fetch_search_page(), municipality_value)
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error accessing search page: {e}")
+            return None
+    
+    def _live_search_data(self, search_data: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """
+        Return search form data from a live search page.
+        
+        A search page replayed from the cache carries day-old hidden fields and
+        no session cookie, so it is fetched again before the first live POST.
+        """
+        if self._search_page_from_cache:
+            try:
+                tree = self._fetch_search_page(refresh=True)
+            except httpx.HTTPError as e:
+                self.logger.error(f"Error accessing search page: {e}")
+                return None
+            if not self._has_search_form(tree):
+                self.logger.error("Search page does not contain the municipality form")
+                return None
+        return self._parse_search_data(self._search_page_tree, search_data['municipality'])
+    
+    def _scrape_all_pages(self, search_data: Dict[str, str], max_pages: Optional[int]) -> List[AntennaRow]:
+        """Scrape all pages of results, replaying them from the cache when possible."""
+        if self.cache:
+            cached_antennas = self._replay_cached_pages(search_data, max_pages)
+            if cached_antennas is not None:
+                return cached_antennas
+            search_data = self._live_search_data(search_data)
+            if search_data is None:
+                return []
+        
+        all_antennas = []
+        fetched_pages = []
+        page_num = 1
+        
+        while True:
+            if max_pages and page_num > max_pages:
+                break
+                
+            self.logger.info(f"Scraping page {page_num}...")
+            
+            try:
+                page_data = self._page_search_data(search_data, page_num)
+                response = self._make_search_request(page_data)
+                if response is None:
+                    break
+                
+                content, encoding = response
+                antennas_on_page, tree = self._process_page(content, encoding, search_data, page_num)
+                
+                if not antennas_on_page:
+                    if page_num == 1:
+                        self.logger.warning("First page returned no results")
+                    break
+                
+                all_antennas.extend(antennas_on_page)
+                fetched_pages.append((page_data, content, encoding))
+                
+                if not self._has_next_page(tree, page_num):
+                    break
+                    
+                page_num += 1
+                
+            except httpx.HTTPError as e:
+                self.logger.error(f"Error on page {page_num}: {e}")
+                break
+        
+        if self.cache:
+            self._store_cached_pages(fetched_pages)
+        
+        self.logger.info(f"Total antennas found: {len(all_antennas)}")
+        return all_antennas
+    
+    def _make_search_request(self, search_data: Dict[str, str]) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Make a search request to the server, returning the raw body and its charset."""
+        try:
+            return self._fetch(
+                self.results_url,
+                data=search_data,
+                headers={
+                    'Content-Type': 'application/x-www-form-urlencoded',
+                    'Referer': self.search_url
+                }
+            )
+        except httpx.HTTPError as e:
+            self.logger.error(f"Search request failed: {e}")
+            return None
+
+
+class AsyncEETTScraper(BaseEETTScraper):
+    """
+    Asynchronous variant of the EETT scraper.
+    
+    Result pages are fetched concurrently over a shared HTTP/2 client, with a
+    semaphore bounding the number of in-flight requests. Form and result parsing
+    is shared with EETTScraper through BaseEETTScraper. Use it as an async context
+    manager, or call run().
+    """
+    
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    def __init__(self, debug: bool = False, cache: Optional[ResponseCache] = None,
+                 dump_html: bool = False, dump_dir: str = '.', concurrency: int = 8,
+                 request_delay: float = 1.0,
+                 max_retries: int = 3):
+        """
+        Initialize the asynchronous EETT scraper.
+        
+        Args:
+            debug (bool): Enable debug mode for verbose logging
+            cache (Optional[ResponseCache]): Cache for raw responses (None to disable caching)
+            dump_html (bool): Save every results page as gzipped HTML for troubleshooting
+            dump_dir (str): Directory for the HTML dumps
+            concurrency (int): Maximum number of requests in flight at once
+            request_delay (float): Seconds each worker waits after a request
+            max_retries (int): Number of retries on HTTP 429/5xx responses
+        """
+        super().__init__(debug=debug, cache=cache, dump_html=dump_html, dump_dir=dump_dir)
+        self.session: Optional[httpx.AsyncClient] = None
+        self.concurrency = concurrency
+        self.request_delay = request_delay
+        self.max_retries = max_retries
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._search_page_lock: Optional[asyncio.Lock] = None
+    
+    async def __aenter__(self) -> 'AsyncEETTScraper':
+        self.session = httpx.AsyncClient(
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            timeout=30,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency,
+                                max_keepalive_connections=self.concurrency)
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._search_page_lock = asyncio.Lock()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.aclose()
+        self.session = None
+    
+    async def run(self, municipality_name: str, max_pages: Optional[int] = None) -> List[AntennaRow]:
+        """
+        Open a session, search a municipality and close the session again.
+        
+        Args:
+            municipality_name (str): Name of the municipality to search
+            max_pages (Optional[int]): Maximum number of pages to scrape (None for all pages)
+        
+        Returns:
+            List[AntennaRow]: Antenna records, with values in FIELDNAMES order
+        """
+        async with self:
+            return await self.search_municipality(municipality_name, max_pages)
+    
+    async def _request(self, method: str, url: str, data: Optional[Dict[str, str]] = None,
+                       headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Optional[str]]:
+        """
+        Perform an HTTP request under the concurrency limit.
+        
+        Returns the raw body and the charset from the Content-Type header, if any.
+        Each worker waits request_delay after its request before releasing its slot.
+        """
+        # The client and semaphore are created in __aenter__, inside the running event loop
+        if self.session is None:
+            raise RuntimeError("AsyncEETTScraper must be used via 'async with scraper:' or run()")
+        
+        async with self._semaphore:
+            response = await self._send(method, url, data=data, headers=headers)
+            await asyncio.sleep(self.request_delay)  # Be respectful to the server
+        return response
+    
+    async def _send(self, method: str, url: str, **kwargs) -> Tuple[bytes, Optional[str]]:
+        """Send an HTTP request, retrying with exponential backoff on 429/5xx."""
+        attempt = 0
+        while True:
+            response = await self.session.request(method, url, **kwargs)
+            if response.status_code not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                response.raise_for_status()
+                return response.content, response.charset_encoding
+            status = response.status_code
+            
+            delay = 2 ** attempt
+            self.logger.warning(f"Got HTTP {status} from {url}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def get_municipality_options(self) -> Dict[str, str]:
+        """
+        Retrieve available municipality options from the search form.
+        
+        Returns:
+            Dict[str, str]: Dictionary mapping municipality names to their form values
+        """
+        if self._municipality_options is not None:
+            return self._municipality_options
+        
+        try:
+            tree = await self._fetch_search_page()
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error getting municipality options: {e}")
+            return {}
+        
+        if not self._has_search_form(tree):
+            self.logger.error("Search page does not contain the municipality form")
+            return {}
+        
+        self._set_municipality_options(self._parse_municipality_options(tree))
+        return self._municipality_options
+    
+    async def _fetch_search_page(self, refresh: bool = False) -> LexborHTMLParser:
+        """
+        Fetch and parse the search page, keeping it once it contains the search form.
+        
+        With refresh, a page replayed from the cache is replaced by a live one.
+        """
+        if self._search_page_tree is None or (refresh and self._search_page_from_cache):
+            cached = (await asyncio.to_thread(self.cache.get, self.search_url)
+                      if self.cache and not refresh else None)
+            content, encoding = cached if cached is not None else await self._request('GET', self.search_url)
+            tree = LexborHTMLParser(_decode_html(content, encoding))
+            
+            # Only keep a page that actually contains the search form
+            if not self._has_search_form(tree):
+                return tree
+            if self.cache and cached is None:
+                await asyncio.to_thread(self.cache.set, self.search_url, None, content, encoding)
+            self._search_page_tree = tree
+            self._search_page_from_cache = cached is not None
+        return self._search_page_tree
+    
+    async def search_municipality(self, municipality_name: str, max_pages: Optional[int] = None) -> List[AntennaRow]:
+        """
+        Search for antenna data in a specific municipality.
+        
+        Args:
+            municipality_name (str): Name of the municipality to search
+            max_pages (Optional[int]): Maximum number of pages to scrape (None for all pages)
+        
+        Returns:
+            List[AntennaRow]: Antenna records, with values in FIELDNAMES order
+        """
+        _, antennas = await self._search(municipality_name, max_pages)
+        return antennas
+    
+    async def _search(self, municipality_name: str,
+                      max_pages: Optional[int] = None) -> Tuple[str, List[AntennaRow]]:
+        """Search a municipality, returning the outcome (a _SEARCH_* status) and the antennas found."""
+        self.logger.info(f"Searching for antennas in municipality: {municipality_name}")
+        
+        # Get municipality options to find the correct value
+        municipality_options = await self.get_municipality_options()
+        if not municipality_options:
+            return _SEARCH_FAILED, []
+        municipality_value = self._find_municipality_value(municipality_name)
+        
+        if not municipality_value:
+            self.logger.error(f"Municipality '{municipality_name}' not found")
+            self._show_available_municipalities(municipality_options)
+            return _SEARCH_NOT_FOUND, []
+        
+        # Get search form structure
+        search_data = await self._prepare_search_data(municipality_value)
+        if not search_data:
+            return _SEARCH_FAILED, []
+        
+        antennas, request_failed = await self._scrape_all_pages(search_data, max_pages)
+        return (_SEARCH_FAILED if request_failed else _SEARCH_OK), antennas
+    
+    async def _prepare_search_data(self, municipality_value: str) -> Optional[Dict[str, str]]:
+        """Prepare the search form data."""
+        try:
+            tree = await self._fetch_search_page()
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error accessing search page: {e}")
+            return None
+        return self._parse_search_data(tree, municipality_value)
+    
+    async def _live_search_data(self, search_data: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """
+        Return search form data from a live search page.
+        
+        A search page replayed from the cache carries day-old hidden fields and
+        no session cookie, so it is fetched again before the first live POST.
+        The lock makes concurrent searches share a single refresh.
+        """
+        async with self._search_page_lock:
+            if self._search_page_from_cache:
+                try:
+                    tree = await self._fetch_search_page(refresh=True)
+                except httpx.HTTPError as e:
+                    self.logger.error(f"Error accessing search page: {e}")
+                    return None
+                if not self._has_search_form(tree):
+                    self.logger.error("Search page does not contain the municipality form")
+                    return None
+        return self._parse_search_data(self._search_page_tree, search_data['municipality'])
+    
+    async def _scrape_all_pages(self, search_data: Dict[str, str],
+                                max_pages: Optional[int]) -> Tuple[List[AntennaRow], bool]:
+        """
+        Scrape all pages of results.
+        
+        The first page is fetched on its own to discover how many pages the
+        pagination bar links to; those pages are then fetched concurrently.
+        This repeats until the last fetched page has no further pages. Cache
+        reads and writes run in a worker thread to keep disk I/O off the event loop.
+        
+        Returns the antennas found and whether a request failed along the way.
+        """
+        if self.cache:
+            cached_antennas = await asyncio.to_thread(self._replay_cached_pages, search_data, max_pages)
+            if cached_antennas is not None:
+                return cached_antennas, False
+            search_data = await self._live_search_data(search_data)
+            if search_data is None:
+                return [], True
+        
+        all_antennas = []
+        fetched_pages = []
+        page_num = 1
+        request_failed = False
+        
+        antennas_on_page, tree, content, encoding = await self._fetch_page(search_data, page_num)
+        if not antennas_on_page:
+            if tree is not None:
+                self.logger.warning("First page returned no results")
+            return all_antennas, tree is None
+        all_antennas.extend(antennas_on_page)
+        fetched_pages.append((self._page_search_data(search_data, page_num), content, encoding))
+        
+        while (not max_pages or page_num < max_pages) and self._has_next_page(tree, page_num):
+            last_page = max(self._last_page_number(tree), page_num + 1)
+            if max_pages:
+                last_page = min(last_page, max_pages)
+            
+            batch = range(page_num + 1, last_page + 1)
+            results = await asyncio.gather(*(self._fetch_page(search_data, n) for n in batch))
+            
+            # Keep pages in order and stop at the first one without results
+            for batch_page_num, (antennas_on_page, page_tree, content, encoding) in zip(batch, results):
+                if not antennas_on_page:
+                    request_failed = page_tree is None
+                    break
+                all_antennas.extend(antennas_on_page)
+                fetched_pages.append((self._page_search_data(search_data, batch_page_num), content, encoding))
+                page_num, tree = batch_page_num, page_tree
+            
+            if page_num < last_page:
+                break
+        
+        if self.cache:
+            await asyncio.to_thread(self._store_cached_pages, fetched_pages)
+        
+        self.logger.info(f"Total antennas found: {len(all_antennas)}")
+        return all_antennas, request_failed
+    
+    async def _fetch_page(self, search_data: Dict[str, str],
+                          page_num: int) -> Tuple[List[AntennaRow], Optional[LexborHTMLParser],
+                                                  bytes, Optional[str]]:
+        """Fetch and parse a single results page, also returning its raw body and charset."""
+        self.logger.info(f"Scraping page {page_num}...")
+        try:
+            content, encoding = await self._request(
+                'POST',
+                self.results_url,
+                data=self._page_search_data(search_data, page_num),
+                headers={
+                    'Content-Type': 'application/x-www-form-urlencoded',
+                    'Referer': self.search_url
+                }
+            )
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error on page {page_num}: {e}")
+            return [], None, b'', None
+        
+        antennas, tree = self._process_page(content, encoding, search_data, page_num)
+        return antennas, tree, content, encoding
+
+
+def _save_results(scraper: BaseEETTScraper, antenna_data: List[AntennaRow],
+                  municipality: str, output_dir: str) -> Tuple[str, str]:
+    """Save antenna data for a municipality to CSV and Excel, returning the file paths."""
+    # Generate safe filename
+    safe_filename = _SAFE_FILENAME_RE1.sub('', municipality).strip()
+    safe_filename = _SAFE_FILENAME_RE2.sub('_', safe_filename)
+    
+    # Create file paths
+    csv_filename = os.path.join(output_dir, f"antennas_{safe_filename}.csv")
+    excel_filename = os.path.join(output_dir, f"antennas_{safe_filename}.xlsx")
+    
+    # Save files
+    scraper.save_to_csv(antenna_data, csv_filename)
+    scraper.save_to_excel(antenna_data, excel_filename)
+    return csv_filename, excel_filename
+
+
+async def _scrape_municipalities(scraper: AsyncEETTScraper, municipalities: List[str],
+                                 max_pages: Optional[int], output_dir: str,
+                                 max_parallel: int = 4
+                                 ) -> List[Union[Tuple[str, List[AntennaRow]], Exception]]:
+    """
+    Scrape several municipalities over a single session.
+    
+    The municipality options are fetched once and shared, at most max_parallel
+    municipalities are searched at a time, and each result is saved off the
+    event loop as soon as it is complete. Each municipality yields its search
+    status (one of the _SEARCH_* values) and antennas, or the exception it
+    raised, without affecting the others.
+    """
+    semaphore = asyncio.Semaphore(max_parallel)
+    
+    async def scrape_one(municipality: str) -> Tuple[str, List[AntennaRow]]:
+        async with semaphore:
+            status, antenna_data = await scraper._search(municipality, max_pages)
+        if antenna_data:
+            await asyncio.to_thread(_save_results, scraper, antenna_data, municipality, output_dir)
+        return status, antenna_data
+    
+    async with scraper:
+        await scraper.get_municipality_options()
+        return await asyncio.gather(*(scrape_one(m) for m in municipalities), return_exceptions=True)
+
+
 def main():
     """Main function to run the scraper."""
     import argparse
@@ -434,6 +1086,7 @@ Examples:
   %(prog)s "Χαλκιδέων"                    # Scrape all pages for Chalkida
   %(prog)s "Αθηναίων" --max-pages 5       # Scrape first 5 pages for Athens
   %(prog)s --list                         # Show available municipalities
+  %(prog)s --municipalities-file list.txt # Scrape every municipality in a file
   %(prog)s "Θεσσαλονίκης" --debug         # Enable debug mode
         """
     )
@@ -442,48 +1095,86 @@ Examples:
                        help='Municipality name to search')
     parser.add_argument('--list', '-l', action='store_true',
                        help='List available municipalities')
+    parser.add_argument('--municipalities-file', metavar='FILE',
+                       help='File with one municipality name per line to scrape in a single run')
     parser.add_argument('--max-pages', type=int, 
                        help='Maximum number of pages to scrape')
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug mode')
+    parser.add_argument('--dump-html', action='store_true',
+                       help='Save each results page as debug_response_<municipality>_page_N.html.gz in the output directory')
+    parser.add_argument('--concurrency', type=int, default=8,
+                       help='Maximum number of concurrent requests (default: 8)')
     parser.add_argument('--output-dir', default='.',
                        help='Output directory for files (default: current directory)')
+    parser.add_argument('--cache', action='store_true',
+                       help='Replay pages cached by earlier runs from the last day (for development)')
+    parser.add_argument('--cache-dir', default='.cache',
+                       help='Directory for cached responses when --cache is given (default: .cache)')
     
     args = parser.parse_args()
+    cache = ResponseCache(args.cache_dir) if args.cache else None
     
     if args.list:
-        scraper = EETTScraper(debug=args.debug)
+        scraper = EETTScraper(debug=args.debug, cache=cache)
         print("Available municipalities:")
         options = scraper.get_municipality_options()
         for name in sorted(options.keys()):
             print(f"  - {name}")
         return
     
-    if not args.municipality:
+    if not args.municipality and not args.municipalities_file:
         parser.error("Municipality name is required (use --list to see available options)")
     
     # Create output directory if it doesn't exist
     if args.output_dir != '.' and not os.path.exists(args.output_dir):
         os.makedirs(args.output_dir)
     
-    scraper = EETTScraper(debug=args.debug)
+    scraper = AsyncEETTScraper(debug=args.debug, cache=cache, dump_html=args.dump_html,
+                               dump_dir=args.output_dir,
+                               concurrency=args.concurrency)
     
     try:
+        if args.municipalities_file:
+            municipalities = [args.municipality] if args.municipality else []
+            with open(args.municipalities_file, encoding='utf-8') as f:
+                municipalities.extend(line.strip() for line in f if line.strip())
+            municipalities = list(dict.fromkeys(municipalities))  # Drop repeats, keeping order
+            
+            results = asyncio.run(_scrape_municipalities(
+                scraper, municipalities, args.max_pages, args.output_dir))
+            
+            # Print summary
+            print(f"\n{'='*50}")
+            print(f"SCRAPING SUMMARY")
+            print(f"{'='*50}")
+            total_antennas = 0
+            files_saved = False
+            for municipality, result in zip(municipalities, results):
+                if isinstance(result, Exception):
+                    print(f"  {municipality}: FAILED ({result})")
+                    continue
+                status, antenna_data = result
+                if status == _SEARCH_NOT_FOUND:
+                    print(f"  {municipality}: not found")
+                elif status == _SEARCH_FAILED and not antenna_data:
+                    print(f"  {municipality}: FAILED (request failed)")
+                else:
+                    note = " (incomplete: request failed)" if status == _SEARCH_FAILED else ""
+                    print(f"  {municipality}: {len(antenna_data)} antennas{note}")
+                    total_antennas += len(antenna_data)
+                    files_saved = files_saved or bool(antenna_data)
+            print(f"Total antennas: {total_antennas}")
+            if files_saved:
+                print(f"Files saved to: {args.output_dir}")
+            return
+        
         # Search for antennas
-        antenna_data = scraper.search_municipality(args.municipality, args.max_pages)
+        antenna_data = asyncio.run(scraper.run(args.municipality, args.max_pages))
         
         if antenna_data:
-            # Generate safe filename
-            safe_filename = re.sub(r'[^\w\s-]', '', args.municipality).strip()
-            safe_filename = re.sub(r'[-\s]+', '_', safe_filename)
-            
-            # Create file paths
-            csv_filename = os.path.join(args.output_dir, f"antennas_{safe_filename}.csv")
-            excel_filename = os.path.join(args.output_dir, f"antennas_{safe_filename}.xlsx")
-            
-            # Save files
-            scraper.save_to_csv(antenna_data, csv_filename)
-            scraper.save_to_excel(antenna_data, excel_filename)
+            csv_filename, excel_filename = _save_results(
+                scraper, antenna_data, args.municipality, args.output_dir)
             
             # Print summary
             print(f"\n{'='*50}")
@@ -499,7 +1190,7 @@ Examples:
             if antenna_data:
                 print(f"\nSample data (first antenna):")
                 print("-" * 30)
-                for key, value in antenna_data[0].items():
+                for key, value in zip(FIELDNAMES, antenna_data[0]):
                     print(f"  {key}: {value}")
                 print("-" * 30)
         else: